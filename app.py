@@ -1,13 +1,20 @@
 import pygame
 import numpy as np
-from scipy.optimize import fsolve
 import sys
 import math
+import functools
 
 # Size of the window
 SCREEN_WIDTH = 1100
 SCREEN_HEIGHT = 700
 G = 9.81 * 100  # Gravity (pixels/s^2). Scale 1m = 100px
+HALF_G = 0.5 * G  # for the free-fall distance 0.5 * G * t^2
+
+# Frame rate cap and fixed physics timestep (physics runs independently of the frame rate)
+FPS_CAP = 144
+IDLE_FPS = 60  # event polling rate while nothing on screen changes
+PHYSICS_DT = 1 / 240
+MAX_FRAME_TIME = 0.25  # longest real frame time fed to the physics, avoids long catch-up loops after stalls
 
 # Define the reset button
 BUTTON_WIDTH = 150
@@ -24,12 +31,31 @@ COLOR_BUTTON_BG = pygame.Color("#7ac8ee") # Button background color
 COLOR_BUTTON_TEXT = pygame.Color("#ffffff") # White text for button
 COLOR_CLICK_BORDER = pygame.Color("#bde1f3")  # Border color for the click-area rectangle
 
+# Zoom steps (exact inverses, so zooming in and back out returns to the same zoom) and limit
+ZOOM_IN = 1.1
+ZOOM_OUT = 1 / ZOOM_IN
+MIN_ZOOM = 0.1
+
+# Above this zoom the paths are drawn with plain (non anti-aliased) lines
+AA_MAX_ZOOM = 4.0
+
+# Static UI strings
+TITLE_STR = "Brachistochrone Problem"
+SUBTITLE_STR = (
+    "Given two points A and B in a vertical plane, what is the curve traced out by a point acted on only by gravity, "
+    "which starts at A and reaches B in the shortest time."
+)
+
+# Unit grid for the cycloid parameter; scaled by theta_b instead of calling linspace per click.
+# Kept in float64 so (theta - sin theta) and (1 - cos theta) stay accurate for small theta_b;
+# the points are only narrowed to float32 when written into the output buffer.
+CYCLOID_SAMPLES = 100
+_U = np.linspace(0, 1, CYCLOID_SAMPLES)
+
 
-def world_to_screen(world_pos, zoom, offset):
-    """Converts world coordinates to screen coordinates."""
-    screen_x = int((world_pos[0] * zoom) + offset[0])
-    screen_y = int((world_pos[1] * zoom) + offset[1])
-    return (screen_x, screen_y)
+def world_to_screen_array(points, zoom, offset):
+    """Converts an (N, 2) array of world coordinates to integer screen coordinates."""
+    return np.round(points * zoom + offset).astype(np.int32)
 
 def screen_to_world(screen_pos, zoom, offset):
     """Converts screen coordinates to world coordinates."""
@@ -37,6 +63,108 @@ def screen_to_world(screen_pos, zoom, offset):
     world_y = (screen_pos[1] - offset[1]) / zoom
     return (world_x, world_y)
 
+def apply_zoom(factor, anchor_screen, zoom, offset):
+    """Zooms by factor while keeping anchor_screen fixed; returns the new (zoom, offset)."""
+    world_pos_before_zoom = screen_to_world(anchor_screen, zoom, offset)
+    zoom = max(MIN_ZOOM, zoom * factor) # Don't zoom out too far
+    # Solve for the offset that maps the same world point back onto the anchor (no pixel rounding)
+    offset = np.asarray(anchor_screen, dtype=float) - np.multiply(world_pos_before_zoom, zoom)
+    return zoom, offset
+
+def _solve_theta(ratio):
+    '''
+    Solves (theta - sin(theta)) = ratio * (1 - cos(theta)) for theta in (0, 2*pi)
+    with a safeguarded Newton iteration.
+        Inputs:
+            ratio: float - |dx| / dy between the two points
+        Outputs:
+            theta_b: float - the cycloid parameter at the end point B
+    '''
+    lo, hi = 0.0, 2 * math.pi  # f < 0 just above 0 and f > 0 at 2*pi, so the root is bracketed
+    x = math.pi
+    for _ in range(50):
+        sin_x = math.sin(x)
+        cos_x = math.cos(x)
+        f = (x - sin_x) - ratio * (1 - cos_x)
+        if abs(f) < 1e-12:
+            return x
+        if f < 0:
+            lo = x
+        else:
+            hi = x
+        fp = 1 - cos_x - ratio * sin_x  # analytic derivative of f
+        x_new = x - f / fp if fp != 0 else lo - 1.0
+        # Fall back to bisection whenever the Newton step leaves the bracket
+        if not (lo < x_new < hi):
+            x_new = 0.5 * (lo + hi)
+        if abs(x_new - x) < 1e-15:
+            return x_new
+        x = x_new
+    raise RuntimeError("Newton iteration for the cycloid did not converge")
+
+def _cycloid_kernel(theta_b, r, direction):
+    '''
+    Samples the cycloid from theta = 0 to theta_b, relative to its starting point.
+        Inputs:
+            theta_b: float - cycloid parameter at the end point
+            r: float - radius of the cycloid
+            direction: float - +1 for right, -1 for left
+        Outputs:
+            (N, 2) float32 array of points
+    '''
+    thetas = _U * theta_b # parameter theta along the cycloid
+    # Fill an (N, 2) float32 buffer directly instead of zipping Python tuples
+    points = np.empty((_U.shape[0], 2), dtype=np.float32)
+    # Computed in float64 and scaled by the radius before narrowing; apply the direction to the x-component
+    points[:, 0] = direction * r * (thetas - np.sin(thetas))
+    points[:, 1] = r * (1 - np.cos(thetas))
+    return points
+
+@functools.lru_cache(maxsize=512)
+def _solve_shape(dx, dy):
+    '''
+    Solves both paths for a displacement (dx, dy) from A to B. The result does not
+    depend on where A is, so it is cached and shared by all translated copies.
+        Inputs:
+            dx, dy: float - displacement from A to B (rounded by the caller)
+        Outputs:
+            None if there is no solution, otherwise a tuple
+            (L, a_line, t_line, r_cycloid, theta_b_cycloid, t_cycloid, direction, rel_points)
+            where rel_points is a read-only (N, 2) float32 array of the cycloid
+            points relative to A (None when the cycloid degenerates into the straight line).
+    '''
+    if dy <= 0: return None   # B must be below A, y-axis downwards
+    L = math.sqrt(dx**2 + dy**2)   # Length of straight line
+    # Horizontal direction (+1 for right, -1 for left) as a plain float for the per-frame bead update
+    direction = 1.0 if dx > 0 else (-1.0 if dx < 0 else 0.0)
+
+    if abs(dx) < 1.0:  # if points are almost vertically aligned - or if the path is straight down
+        a_line = G
+        t_line = math.sqrt(2 * L / a_line)  # time to fall a distance L under gravity G
+        t_cycloid = t_line  # time for cycloid is same as line in this case
+        r_cycloid = float('inf')  # a straight line with infinite radius of curvature
+        theta_b_cycloid = 0
+        return L, a_line, t_line, r_cycloid, theta_b_cycloid, t_cycloid, direction, None
+
+    a_line = G * dy / L  # acceleration along the line a = g sin(theta) = g * (dy / L)
+    t_line = math.sqrt(2 * L / a_line)   # time to fall distance L under acceleration a_line follow the straightline ( d = 0.5*a*t^2 )
+
+    # Use the absolute horizontal distance for the ratio calculation
+    abs_dx = abs(dx)
+    ratio = abs_dx / dy
+
+    try:   # find time for the cycloid path
+        theta_b_cycloid = _solve_theta(ratio)
+        r_cycloid = dy / (1 - math.cos(theta_b_cycloid))  # radius of the cycloid
+        t_cycloid = theta_b_cycloid * math.sqrt(r_cycloid / G)  # time for cycloid ( time to travel from 0 to theta_b )
+    except (RuntimeError, ValueError):
+        return None
+
+    rel_points = _cycloid_kernel(theta_b_cycloid, r_cycloid, direction)
+    # The array is shared between cache hits, so guard it against in-place edits
+    rel_points.flags.writeable = False
+    return L, a_line, t_line, r_cycloid, theta_b_cycloid, t_cycloid, direction, rel_points
+
 def calculate_paths(A, B):
     '''
     This function calculates time for both straight line and cycloid paths
@@ -49,7 +177,8 @@ def calculate_paths(A, B):
                 "A", "B", "dx", "dy", "line_L", "line_a",
                 "line_t", "line_points", "cycloid_r",
                 "cycloid_theta_b", "cycloid_t",
-                "cycloid_points"
+                "cycloid_points", "dir", "half_a", "inv_line_L",
+                "inv_sqrt_r_over_g"
     
     '''
     xa, ya = A
@@ -57,57 +186,92 @@ def calculate_paths(A, B):
     dx = xb - xa
     dy = yb - ya
     
-    if dy <= 0: return None   # B must be below A, y-axis downwards
-    L = math.sqrt(dx**2 + dy**2)   # Length of straight line
-
-    if abs(dx) < 1.0:  # if points are almost vertically aligned - or if the path is straight down
-        a_line = G
-        t_line = math.sqrt(2 * L / a_line)  # time to fall a distance L under gravity G
-        t_cycloid = t_line  # time for cycloid is same as line in this case
-        r_cycloid = float('inf')  # a straight line with infinite radius of curvature
-        theta_b_cycloid = 0
-    else:  # if not vertically aligned - other cases
-        a_line = G * dy / L  # acceleration along the line a = g sin(theta) = g * (dy / L)
-        t_line = math.sqrt(2 * L / a_line)   # time to fall distance L under acceleration a_line follow the straightline ( d = 0.5*a*t^2 )
-        
-        # Use the absolute horizontal distance for the ratio calculation
-        abs_dx = abs(dx)
-        ratio = abs_dx / dy
-
-        try:   # find time for the cycloid path
-            theta_b_cycloid = fsolve(
-                lambda th: (th - math.sin(th)) - ratio * (1 - math.cos(th)),
-                math.pi
-            )[0]
-            r_cycloid = dy / (1 - math.cos(theta_b_cycloid))  # radius of the cycloid
-            t_cycloid = theta_b_cycloid * math.sqrt(r_cycloid / G)  # time for cycloid ( time to travel from 0 to theta_b )
-        except (RuntimeError, ValueError):
-            return None
-
-    line_points = [A, B]
-    if np.isinf(r_cycloid):  # check if the r_cycloid is infinite (almost vertical line)
+    # The shape only depends on (dx, dy); quantize it so nearby clicks share a cache entry.
+    # _solve_shape also rejects B not below A.
+    shape = _solve_shape(round(dx, 3), round(dy, 3))
+    if shape is None:
+        return None
+    L, a_line, t_line, r_cycloid, theta_b_cycloid, t_cycloid, direction, rel_points = shape
+
+    line_points = np.array((A, B), dtype=np.float32)  # (2, 2) like cycloid_points
+    if math.isinf(r_cycloid):  # check if the r_cycloid is infinite (almost vertical line)
         cycloid_points = line_points  
-    else:  # cycloid case
-        # Get the direction (+1 for right, -1 for left)
-        direction = np.sign(dx)
-        thetas = np.linspace(0, theta_b_cycloid, 100) # parameter theta along the cycloid
-        # Apply the direction to the x-component
-        cycloid_x = xa + direction * r_cycloid * (thetas - np.sin(thetas))
-        cycloid_y = ya + r_cycloid * (1 - np.cos(thetas))
-        cycloid_points = list(zip(cycloid_x, cycloid_y))
+    else:  # cycloid case - shift the cached shape so it starts at A
+        cycloid_points = rel_points + np.array((xa, ya), dtype=np.float32)
         
     return {
         "A": A, "B": B, "dx": dx, "dy": dy, "line_L": L, "line_a": a_line,
         "line_t": t_line, "line_points": line_points, "cycloid_r": r_cycloid,
         "cycloid_theta_b": theta_b_cycloid, "cycloid_t": t_cycloid,
-        "cycloid_points": cycloid_points,
+        "cycloid_points": cycloid_points, "dir": direction,
+        # Per-simulation constants for the bead update, so it needs no sqrt or division per step
+        "half_a": 0.5 * a_line, "inv_line_L": 1 / L,
+        "inv_sqrt_r_over_g": 1 / math.sqrt(r_cycloid / G),  # 0 for the vertical (infinite radius) case
     }
 
-def draw_text_centered(surface, text, font, color, rect):
+def compute_layout(screen_width, screen_height, subtitle_w):
+    '''
+    Computes the UI rects for the current window size.
+        Inputs:
+            screen_width, screen_height: int - window size
+            subtitle_w: int - pixel width of the rendered subtitle
+        Outputs:
+            (reset_button_rect, click_area_rect)
+    '''
+    reset_button_rect = pygame.Rect(
+        (screen_width - BUTTON_WIDTH) // 2,
+        screen_height - BUTTON_HEIGHT - 30,
+        BUTTON_WIDTH,
+        BUTTON_HEIGHT
+    )
+    # Define the allowed click area (centered between the subtitle and the reset button)
+    # Width will match the pixel width of the subtitle text so the rect aligns with the subtitle.
+    click_area_w = subtitle_w 
+    # compute available vertical space between subtitle (y ~= 80) and top of reset button
+    available_h = max(150, reset_button_rect.top - 120)
+    # and a bit taller (use 0.9 of available vertical space)
+    click_area_h = int(available_h * 0.9)
+    click_area_top = int((80 + reset_button_rect.top) / 2 - click_area_h / 2)
+    click_area_rect = pygame.Rect(
+        (screen_width - click_area_w) // 2,
+        click_area_top,
+        click_area_w,
+        click_area_h,
+    )
+    return reset_button_rect, click_area_rect
+
+def visible_runs(points, width, height):
     '''
-    Helper function to draw centered text in a given rectangle.
+    Splits a screen-space polyline into the contiguous runs of segments whose
+    bounding box overlaps the screen.
+        Inputs:
+            points: (N, 2) array of screen coordinates
+            width, height: int - screen size
+        Outputs:
+            list of (M, 2) arrays, each with at least two points
+    '''
+    lo = np.minimum(points[:-1], points[1:])
+    hi = np.maximum(points[:-1], points[1:])
+    seg_visible = (hi[:, 0] >= 0) & (lo[:, 0] < width) & (hi[:, 1] >= 0) & (lo[:, 1] < height)
+    # Start/end indices of each run of visible segments; a run of segments s..e-1 uses points s..e
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], seg_visible, [False])).astype(np.int8)))
+    return [points[start:end + 1] for start, end in zip(edges[::2], edges[1::2])]
+
+def draw_polyline(surface, color, points, zoom):
+    '''
+    Draws the on-screen parts of a screen-space polyline, anti-aliased unless zoomed in far.
+    '''
+    width, height = surface.get_size()
+    for run in visible_runs(points, width, height):
+        if zoom < AA_MAX_ZOOM:
+            pygame.draw.aalines(surface, color, False, run.tolist(), 3)
+        else:
+            pygame.draw.lines(surface, color, False, run.tolist())
+
+def blit_centered(surface, text_obj, rect):
+    '''
+    Helper function to blit already rendered text centered in a given rectangle.
     '''
-    text_obj = font.render(text, True, color)
     text_rect = text_obj.get_rect(center=rect.center)
     surface.blit(text_obj, text_rect)
 
@@ -156,6 +320,15 @@ def main():
     font_button = pygame.font.SysFont("Times New Roman", 20, bold=True)
     font_winner = pygame.font.SysFont("Times New Roman", 60, bold=True)
 
+    # Pre-rendered static text (rendering every frame is the costliest part of drawing)
+    title_surf = font_title.render(TITLE_STR, True, COLOR_TITLE)
+    subtitle_surf = font_subtitle.render(SUBTITLE_STR, True, COLOR_TEXT)
+    instr_pick_a_surf = font_main.render("Click anywhere to set Point A", True, COLOR_TEXT)
+    instr_pick_b_surf = font_main.render("Click anywhere *below* Point A to set Point B", True, COLOR_TEXT)
+    label_a_surf = font_small.render("A", True, COLOR_TEXT)
+    label_b_surf = font_small.render("B", True, COLOR_TEXT)
+    reset_label_surf = font_button.render("New Simulation", True, COLOR_BUTTON_TEXT)
+
     # --- App and Camera State ---
     state = 'pick_a'
     point_a_world = None # Points are now stored in "world" space
@@ -164,7 +337,7 @@ def main():
     
     # Camera
     zoom = 1.0
-    offset = [0, 0]
+    offset = np.zeros(2)  # float64 2-vector, so pan/zoom updates are single vector operations
     panning = False
     
     # Sim variables
@@ -173,47 +346,50 @@ def main():
     cycloid_finished = False
     pos_line_world = None
     pos_cycloid_world = None
+    physics_accum = 0.0
+    cyc_sin, cyc_cos = 0.0, 1.0
+    cyc_cos_d, cyc_sin_d = 1.0, 0.0
+
+    # Background and paths pre-rendered onto an opaque surface, cached until the camera, window or sim_data changes.
+    # sim_data is held by reference (not id()) so a new dict can never alias a freed one.
+    path_sim_data = None
+    path_cache_key = None
+    path_surface = None
+
+    # Click-area overlay surfaces keyed on (width, height)
+    overlay_cache = {}
+
+    # Result time text, rendered once per sim_data
+    times_sim_data = None
+    text_line = None
+    text_cyc = None
+
+    # Dirty-rect rendering: the whole window is only repainted after a change
+    full_redraw = True
+    prev_bead_rects = []
+
+    # Last known mouse position, kept up to date from mouse events (used as the zoom anchor)
+    mouse_pos_screen = pygame.mouse.get_pos()
     
+    # UI rects only change with the window size, so they are recomputed on VIDEORESIZE only
+    subtitle_w, subtitle_h = font_subtitle.size(SUBTITLE_STR)
+    screen_width, screen_height = screen.get_size()
+    RESET_BUTTON_RECT, click_area_rect = compute_layout(screen_width, screen_height, subtitle_w)
+
     running = True
     while running:
-        # Get current window size and compute UI rects so they respond to resizing
-        screen_width, screen_height = screen.get_size()
-        RESET_BUTTON_RECT = pygame.Rect(
-            (screen_width - BUTTON_WIDTH) // 2,
-            screen_height - BUTTON_HEIGHT - 30,
-            BUTTON_WIDTH,
-            BUTTON_HEIGHT
-        )
-        # Define the allowed click area (centered between the subtitle and the reset button)
-        # Width will match the pixel width of the subtitle text so the rect aligns with the subtitle.
-        subtitle_str = (
-            "Given two points A and B in a vertical plane, what is the curve traced out by a point acted on only by gravity, "
-            "which starts at A and reaches B in the shortest time."
-        )
-        subtitle_w, subtitle_h = font_subtitle.size(subtitle_str)
-        # Use the subtitle width as the click area width (optionally add a little horizontal padding)
-        horiz_padding = 20
-        click_area_w = subtitle_w 
-        # compute available vertical space between subtitle (y ~= 80) and top of reset button
-        available_h = max(150, RESET_BUTTON_RECT.top - 120)
-        # and a bit taller (use 0.9 of available vertical space)
-        click_area_h = int(available_h * 0.9)
-        click_area_top = int((80 + RESET_BUTTON_RECT.top) / 2 - click_area_h / 2)
-        click_area_rect = pygame.Rect(
-            (screen_width - click_area_w) // 2,
-            click_area_top,
-            click_area_w,
-            click_area_h,
-        )
         # --- Event Handling ---
-        mouse_pos_screen = pygame.mouse.get_pos()
-        
         for event in pygame.event.get():
+            # Anything but a plain mouse move (no pan) can change what is on screen
+            if event.type != pygame.MOUSEMOTION or panning:
+                full_redraw = True
+
             if event.type == pygame.QUIT:
                 running = False
             
             # Check for mouse button events
             elif event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pos_screen = event.pos
                 if event.button == 3:  # if right-click
                     panning = True
                 elif event.button == 1: # Left-click
@@ -225,7 +401,7 @@ def main():
                         point_b_world = None
                         sim_data = None
                         zoom = 1.0
-                        offset = [0, 0]
+                        offset = np.zeros(2)
                     else:
                         # Only accept simulation clicks when they fall inside the designated click area
                         if not click_area_rect.collidepoint(mouse_pos_screen):
@@ -255,6 +431,11 @@ def main():
                                     cycloid_finished = False
                                     pos_line_world = point_a_world
                                     pos_cycloid_world = point_a_world
+                                    physics_accum = 0.0
+                                    # Cycloid bead angle tracked as (sin, cos), rotated by a fixed angle each physics step
+                                    cyc_sin, cyc_cos = 0.0, 1.0
+                                    dtheta = PHYSICS_DT * sim_data['inv_sqrt_r_over_g']
+                                    cyc_cos_d, cyc_sin_d = math.cos(dtheta), math.sin(dtheta)
                                 else:
                                     print("Error: Could not solve.")
                                     point_b_world = None
@@ -264,25 +445,13 @@ def main():
                     panning = False
                     
             elif event.type == pygame.MOUSEMOTION:
+                mouse_pos_screen = event.pos
                 if panning:
-                    offset[0] += event.rel[0]
-                    offset[1] += event.rel[1]
+                    offset += event.rel
             
             # --- Camera: Zooming ---
             elif event.type == pygame.MOUSEWHEEL:
-                world_pos_before_zoom = screen_to_world(mouse_pos_screen, zoom, offset)
-                
-                if event.y > 0:
-                    zoom *= 1.1 # Zoom in
-                else:
-                    zoom *= 0.9 # Zoom out
-                zoom = max(0.1, zoom) # Don't zoom out too far
-                
-                screen_pos_after_zoom = world_to_screen(world_pos_before_zoom, zoom, offset)
-                
-                # Adjust offset to keep mouse position fixed
-                offset[0] += mouse_pos_screen[0] - screen_pos_after_zoom[0]
-                offset[1] += mouse_pos_screen[1] - screen_pos_after_zoom[1]
+                zoom, offset = apply_zoom(ZOOM_IN if event.y > 0 else ZOOM_OUT, mouse_pos_screen, zoom, offset)
             
             # --- Keyboard Controls: exit, zoom, reset ---
             elif event.type == pygame.KEYDOWN:
@@ -293,129 +462,148 @@ def main():
                 # Reset view with 0
                 elif event.key == pygame.K_0:
                     zoom = 1.0
-                    offset = [0, 0]
+                    offset = np.zeros(2)
 
                 else:
                     # Attempt to use unicode for '+' and '-' (handles shifted '=' key too)
                     ch = getattr(event, 'unicode', '')
                     # Zoom in with +, = or keypad +
                     if ch == '+' or ch == '=' or event.key == pygame.K_KP_PLUS:
-                        world_pos_before_zoom = screen_to_world(mouse_pos_screen, zoom, offset)
-                        zoom *= 1.1
-                        zoom = max(0.1, zoom)
-                        screen_pos_after_zoom = world_to_screen(world_pos_before_zoom, zoom, offset)
-                        offset[0] += mouse_pos_screen[0] - screen_pos_after_zoom[0]
-                        offset[1] += mouse_pos_screen[1] - screen_pos_after_zoom[1]
+                        zoom, offset = apply_zoom(ZOOM_IN, mouse_pos_screen, zoom, offset)
 
                     # Zoom out with - or keypad -
                     elif ch == '-' or event.key == pygame.K_KP_MINUS:
-                        world_pos_before_zoom = screen_to_world(mouse_pos_screen, zoom, offset)
-                        zoom *= 0.9
-                        zoom = max(0.1, zoom)
-                        screen_pos_after_zoom = world_to_screen(world_pos_before_zoom, zoom, offset)
-                        offset[0] += mouse_pos_screen[0] - screen_pos_after_zoom[0]
-                        offset[1] += mouse_pos_screen[1] - screen_pos_after_zoom[1]
+                        zoom, offset = apply_zoom(ZOOM_OUT, mouse_pos_screen, zoom, offset)
 
             # Window resize event
             elif event.type == pygame.VIDEORESIZE:
                 # Recreate the screen surface at the new size and keep RESIZABLE
                 screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
                 screen_width, screen_height = event.w, event.h
+                RESET_BUTTON_RECT, click_area_rect = compute_layout(screen_width, screen_height, subtitle_w)
 
         # Simulation Update ---
         if state == 'simulate':
-            dt = clock.get_time() / 1000.0
-            sim_time += dt
-
-            # Update Line Bead
-            if not line_finished:
-                t = sim_data['line_t']
-                if sim_time < t:
-                    dist = 0.5 * sim_data['line_a'] * sim_time**2
-                    frac = dist / sim_data['line_L']
-                    pos_line_world = (
-                        point_a_world[0] + frac * sim_data['dx'],
-                        point_a_world[1] + frac * sim_data['dy']
-                    )
-                else:
-                    pos_line_world = point_b_world
-                    line_finished = True
-
-            # Update Cycloid Bead
-            if not cycloid_finished:
-                t = sim_data['cycloid_t']
-                if sim_time < t:
-                    if np.isinf(sim_data['cycloid_r']):
-                        dist = 0.5 * G * sim_time**2
-                        frac = dist / sim_data['dy']
-                        pos_cycloid_world = (point_a_world[0], point_a_world[1] + frac * sim_data['dy'])
-                    else:
-                        r = sim_data['cycloid_r']
-                        theta_t = sim_time / math.sqrt(r / G)
-                        
-                        # --- MODIFICATION FOR LEFT/RIGHT ---
-                        # Get direction from stored dx
-                        direction = np.sign(sim_data['dx'])
-                        pos_cycloid_world = (
-                            # Apply the direction to the x-component
-                            point_a_world[0] + direction * r * (theta_t - math.sin(theta_t)),
-                            point_a_world[1] + r * (1 - math.cos(theta_t))
+            # Fixed-step physics: the real frame time is consumed in PHYSICS_DT steps,
+            # so the bead motion does not depend on the frame rate
+            physics_accum += min(clock.get_time() / 1000.0, MAX_FRAME_TIME)
+            while physics_accum >= PHYSICS_DT and state == 'simulate':
+                physics_accum -= PHYSICS_DT
+                sim_time += PHYSICS_DT
+
+                # Update Line Bead
+                if not line_finished:
+                    t = sim_data['line_t']
+                    if sim_time < t:
+                        dist = sim_data['half_a'] * sim_time * sim_time
+                        frac = dist * sim_data['inv_line_L']
+                        pos_line_world = (
+                            point_a_world[0] + frac * sim_data['dx'],
+                            point_a_world[1] + frac * sim_data['dy']
                         )
-                        # --- END MODIFICATION ---
-                else:
-                    pos_cycloid_world = point_b_world
-                    cycloid_finished = True
+                    else:
+                        pos_line_world = point_b_world
+                        line_finished = True
+
+                # Update Cycloid Bead
+                if not cycloid_finished:
+                    t = sim_data['cycloid_t']
+                    if sim_time < t:
+                        if math.isinf(sim_data['cycloid_r']):
+                            # Free fall straight down: the fraction of dy times dy is just the distance
+                            dist = HALF_G * sim_time * sim_time
+                            pos_cycloid_world = (point_a_world[0], point_a_world[1] + dist)
+                        else:
+                            r = sim_data['cycloid_r']
+                            theta_t = sim_time * sim_data['inv_sqrt_r_over_g']
+
+                            # Advance (sin, cos) of theta_t by the constant per-step rotation
+                            # with the angle-addition formulas instead of calling sin/cos
+                            cyc_sin, cyc_cos = cyc_sin * cyc_cos_d + cyc_cos * cyc_sin_d, cyc_cos * cyc_cos_d - cyc_sin * cyc_sin_d
+                            
+                            # --- MODIFICATION FOR LEFT/RIGHT ---
+                            # Get direction stored when the paths were calculated
+                            direction = sim_data['dir']
+                            pos_cycloid_world = (
+                                # Apply the direction to the x-component
+                                point_a_world[0] + direction * r * (theta_t - cyc_sin),
+                                point_a_world[1] + r * (1 - cyc_cos)
+                            )
+                            # --- END MODIFICATION ---
+                    else:
+                        pos_cycloid_world = point_b_world
+                        cycloid_finished = True
 
-            if line_finished and cycloid_finished:
-                state = 'results'
+                if line_finished and cycloid_finished:
+                    state = 'results'
+                    full_redraw = True  # the result times appear
 
         # --- 3. Drawing ---
-        screen.fill(COLOR_BG)
+        # Nothing moves outside of the simulation, so idle frames keep the last picture as is
+        if not full_redraw and state != 'simulate':
+            clock.tick(IDLE_FPS)
+            continue
+
+        bead_rects = []
+        if state == 'simulate' or state == 'results':
+            # --- Background + Paths (pre-rendered on an opaque surface; only redrawn when the camera, window or paths change) ---
+            path_cam_key = (zoom, offset[0], offset[1], screen_width, screen_height)
+            if sim_data is not path_sim_data or path_cam_key != path_cache_key:
+                # Reuse the surface while the window size is unchanged (e.g. on every pan step)
+                if path_surface is None or path_surface.get_size() != (screen_width, screen_height):
+                    path_surface = pygame.Surface((screen_width, screen_height)).convert()
+                path_surface.fill(COLOR_BG)
+                screen_line_points = world_to_screen_array(sim_data['line_points'], zoom, offset)
+                screen_cycloid_points = world_to_screen_array(sim_data['cycloid_points'], zoom, offset)
+                draw_polyline(path_surface, COLOR_LINE, screen_line_points, zoom)
+                draw_polyline(path_surface, COLOR_CYCLOID, screen_cycloid_points, zoom)
+                path_sim_data = sim_data
+                path_cache_key = path_cam_key
+
+            # Replaces the background fill, so the paths cost one opaque blit
+            screen.blit(path_surface, (0, 0))
+        else:
+            screen.fill(COLOR_BG)
 
         # --- Draw Simulation (in World Space) ---
+        # The handful of single points drawn every frame are converted to screen space inline
+        # (rounded like world_to_screen_array, so the beads sit exactly on their paths)
+        ox, oy = offset
         if point_a_world:
-            pos_a_screen = world_to_screen(point_a_world, zoom, offset)
+            pos_a_screen = (int(round(point_a_world[0] * zoom + ox)), int(round(point_a_world[1] * zoom + oy)))
             pygame.draw.circle(screen, COLOR_POINT, pos_a_screen, 10)
-            screen.blit(font_small.render("A", True, COLOR_TEXT), (pos_a_screen[0] - 25, pos_a_screen[1] - 10))
+            screen.blit(label_a_surf, (pos_a_screen[0] - 25, pos_a_screen[1] - 10))
 
         if state == 'simulate' or state == 'results':
             # Draw Point B
-            pos_b_screen = world_to_screen(point_b_world, zoom, offset)
+            pos_b_screen = (int(round(point_b_world[0] * zoom + ox)), int(round(point_b_world[1] * zoom + oy)))
             pygame.draw.circle(screen, COLOR_POINT, pos_b_screen, 10)
-            screen.blit(font_small.render("B", True, COLOR_TEXT), (pos_b_screen[0] + 15, pos_b_screen[1] - 10))
-            
-            # --- Draw Paths (Must transform all points) ---
-            screen_line_points = [world_to_screen(p, zoom, offset) for p in sim_data['line_points']]
-            screen_cycloid_points = [world_to_screen(p, zoom, offset) for p in sim_data['cycloid_points']]
-            
-            pygame.draw.aalines(screen, COLOR_LINE, False, screen_line_points, 3)
-            pygame.draw.aalines(screen, COLOR_CYCLOID, False, screen_cycloid_points, 3)
+            screen.blit(label_b_surf, (pos_b_screen[0] + 15, pos_b_screen[1] - 10))
             
             # Draw Beads
-            pos_line_screen = world_to_screen(pos_line_world, zoom, offset)
-            pos_cycloid_screen = world_to_screen(pos_cycloid_world, zoom, offset)
+            pos_line_screen = (int(round(pos_line_world[0] * zoom + ox)), int(round(pos_line_world[1] * zoom + oy)))
+            pos_cycloid_screen = (int(round(pos_cycloid_world[0] * zoom + ox)), int(round(pos_cycloid_world[1] * zoom + oy)))
             pygame.draw.circle(screen, COLOR_LINE, pos_line_screen, 8)
             pygame.draw.circle(screen, COLOR_CYCLOID, pos_cycloid_screen, 8)
+            bead_rects = [
+                pygame.Rect(pos_line_screen[0] - 10, pos_line_screen[1] - 10, 20, 20),
+                pygame.Rect(pos_cycloid_screen[0] - 10, pos_cycloid_screen[1] - 10, 20, 20),
+            ]
 
         
         # --- Draw UI (in Screen Space) ---
 
         # Title
-        title_text = font_title.render("Brachistochrone Problem", True, COLOR_TITLE)
-        screen.blit(title_text, (screen_width // 2 - title_text.get_width() // 2, 20))
+        screen.blit(title_surf, (screen_width // 2 - title_surf.get_width() // 2, 20))
 
         # Subtitle
-        subtitle_text = font_subtitle.render(
-            "Given two points A and B in a vertical plane, what is the curve traced out by a point acted on only by gravity, "
-            "which starts at A and reaches B in the shortest time.", True, COLOR_TEXT
-        )
-        screen.blit(subtitle_text, (screen_width // 2 - subtitle_text.get_width() // 2, 80))
+        screen.blit(subtitle_surf, (screen_width // 2 - subtitle_surf.get_width() // 2, 80))
 
         # Instructions (render inside the click-area rectangle so users know where to click)
         if state == 'pick_a':
-            text = font_main.render("Click anywhere to set Point A", True, COLOR_TEXT)
+            text = instr_pick_a_surf
         elif state == 'pick_b':
-            text = font_main.render("Click anywhere *below* Point A to set Point B", True, COLOR_TEXT)
+            text = instr_pick_b_surf
         else:
             text = None
 
@@ -425,24 +613,33 @@ def main():
             text_y = click_area_rect.top + 8
             screen.blit(text, (text_x, text_y))
 
-        # Draw the allowed click area (translucent overlay + border)
-        try:
-            overlay = pygame.Surface((click_area_rect.width, click_area_rect.height), pygame.SRCALPHA)
-            overlay.fill((200, 200, 200, 30))  # light translucent gray
+        # Draw the allowed click area (translucent overlay + border), built once per area size
+        overlay = overlay_cache.get(click_area_rect.size)
+        if overlay is None:
+            try:
+                overlay = pygame.Surface(click_area_rect.size, pygame.SRCALPHA)
+                overlay.fill((200, 200, 200, 30))  # light translucent gray
+                # Bake the border in using requested color
+                pygame.draw.rect(overlay, COLOR_CLICK_BORDER, overlay.get_rect(), 2)
+            except Exception:
+                # If anything fails, skip translucent overlay
+                overlay = False
+            overlay_cache.clear()  # only the current size is ever needed again
+            overlay_cache[click_area_rect.size] = overlay
+        if overlay:
             screen.blit(overlay, click_area_rect.topleft)
-        except Exception:
-            # If anything fails, skip translucent overlay
-            pass
-        # Draw border using requested color
-        pygame.draw.rect(screen, COLOR_CLICK_BORDER, click_area_rect, 2)
+        else:
+            pygame.draw.rect(screen, COLOR_CLICK_BORDER, click_area_rect, 2)
 
         # Times (centered below the click-area) - show only after both beads finish (state == 'results')
         if state == 'results' and sim_data:
-            # Render each time in the matching color for clarity
-            t_line_str = f"Line: {sim_data['line_t']:.3f} s"
-            t_cyc_str = f"Cycloid: {sim_data['cycloid_t']:.3f} s"
-            text_line = font_main.render(t_line_str, True, COLOR_LINE)
-            text_cyc = font_main.render(t_cyc_str, True, COLOR_CYCLOID)
+            if sim_data is not times_sim_data:
+                # Render each time in the matching color for clarity
+                t_line_str = f"Line: {sim_data['line_t']:.3f} s"
+                t_cyc_str = f"Cycloid: {sim_data['cycloid_t']:.3f} s"
+                text_line = font_main.render(t_line_str, True, COLOR_LINE)
+                text_cyc = font_main.render(t_cyc_str, True, COLOR_CYCLOID)
+                times_sim_data = sim_data
 
             # compute combined width and position them with small gap
             gap = 20
@@ -455,11 +652,16 @@ def main():
 
         # Reset Button
         pygame.draw.rect(screen, COLOR_BUTTON_BG, RESET_BUTTON_RECT, border_radius=10)
-        draw_text_centered(screen, "New Simulation", font_button, COLOR_BUTTON_TEXT, RESET_BUTTON_RECT)
+        blit_centered(screen, reset_label_surf, RESET_BUTTON_RECT)
 
-        # Final Flip
-        pygame.display.flip()
-        clock.tick(60) 
+        # Present the frame: everything after a change, otherwise only where the beads were and are now
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(prev_bead_rects + bead_rects)
+        prev_bead_rects = bead_rects
+        full_redraw = False
+        clock.tick(FPS_CAP) 
 
     pygame.quit()
     sys.exit()